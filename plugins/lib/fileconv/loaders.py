@@ -155,6 +155,8 @@ class LoaderProto(object):
     scope   = None
     file_regex = ""
     output_panel_name = "package_dev"
+    ext_regex  = None
+    opt_regex  = None
 
     def __init__(self, window, view, file_path=None, output=None, *args, **kwargs):
         """Mirror the parameters to ``self``, do "init" stuff.
@@ -182,10 +184,10 @@ class LoaderProto(object):
     def _pre_init_(cls):
         """Assign attributes that depend on other attributes defined by subclasses.
         """
-        if not hasattr(cls, 'ext_regex'):
+        if cls.ext_regex is None:
             cls.ext_regex = r'(?i)\.%s(?:-([^\.]+))?$' % cls.ext
 
-        if not hasattr(cls, 'opt_regex'):
+        if cls.opt_regex is None:
             # Will result in an exception when running cls.load_options but will be caught.
             cls.opt_regex = cls.comment and r'^\s*%s\s+\[PackageDev\]\s+(.+)$' % cls.comment or ""
 
@@ -2,9 +2,10 @@ import logging
 
 import sublime
 
-from .data import DATA
+from .data import SCOPES, is_valid_scope, lookup_prefix
 
-__all__ = ["COMPILED_NODES", "COMPILED_HEADS", "completions_from_prefix"]
+__all__ = ["COMPILED_NODES", "COMPILED_HEADS", "completions_from_prefix",
+           "is_valid_scope", "lookup_prefix"]
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,8 @@ class ScopeNode(object):
         * tree()
     """
 
+    __slots__ = ('name', 'parent', 'children', 'level')
+
     def __init__(self, name, parent=None, children=None):
         self.name = name
         self.parent = parent
@@ -92,40 +95,19 @@ class ScopeNode(object):
 COMPILED_NODES = NodeSet()
 COMPILED_HEADS = NodeSet()
 
-# parse the DATA string
-lines = DATA.split("\n")
-
-# some variables
-indent = " " * 4
-indent_level = 0
-indents = {}
-
-# process lines
-# Note: expects sane indentation (such as only indent by 1 `indent` at a time)
-for line in lines:
-    if line.isspace() or not len(line):
-        # skip blank lines
-        continue
-    if line.startswith(indent * (indent_level + 1)):
-        # indent increased
-        indent_level += 1
-    if not line.startswith(indent * indent_level):
-        # indent decreased
-        for level in range(indent_level - 1, 0, -1):
-            if line.startswith(indent * level):
-                indent_level = level
-                break
-
-    parent = indents[indent_level - 1] if indent_level - 1 in indents else None
-    node = ScopeNode(line.strip(), parent)
-    indents[indent_level] = node
-
-    if parent:
-        parent.add_child(node)
-    else:
-        COMPILED_HEADS.add(node)
 
-    COMPILED_NODES.add(node)
+def _compile(scopes, parent=None):
+    for name, children in scopes.items():
+        node = ScopeNode(name, parent)
+        if parent:
+            parent.add_child(node)
+        else:
+            COMPILED_HEADS.add(node)
+        COMPILED_NODES.add(node)
+        _compile(children, node)
+
+
+_compile(SCOPES)
 
 
 # Tokenize the current selector
@@ -136,20 +118,20 @@ def completions_from_prefix(prefix):
         # No work to be done here, just return the heads
         return COMPILED_HEADS.to_completion()
 
-    # Browse the nodes and their children
-    nodes = COMPILED_HEADS
+    # Walk down the scope tree
+    scopes = SCOPES
     for i, token in enumerate(tokens[:-1]):
-        node = nodes.find(token)
-        if not node:
+        if token not in scopes:
             logger.info("`%s` not found in scope naming conventions", '.'.join(tokens[:i + 1]))
             break
-        nodes = node.children
-        if not nodes:
+        scopes = scopes[token]
+        if not scopes:
             logger.info("No nodes available in scope naming conventions after `%s`",
                         '.'.join(tokens[:-1]))
             break
     else:
         # Offer to complete from conventions or base scope
-        return nodes.to_completion()
+        return [sublime.CompletionItem(name, annotation="convention", kind=SCOPE_KIND)
+                for name in scopes]
 
     return []
@@ -1,307 +1,60 @@
-# https://www.sublimetext.com/docs/3/scope_naming.html
-# https://manual.macromates.com/en/language_grammars#naming_conventions
-DATA = """
-    comment
-        line
-            double-slash
-            double-dash
-            number-sign
-            percentage
-            semi-colon
-        block
-            documentation
+import functools
+import sys
+import types
 
-    constant
-        numeric
-            base
-            value
-            suffix
-        character
-            escape
-        language
-            infinity
-            nan
-        other
-            placeholder
+from ._scopes import SCOPES as SCOPE_TREE
 
-    entity
-        name
-            class
-                forward-decl
-            struct
-            enum
-            union
-            trait
-            interface
-            impl
-            type
-            function
-                constructor
-                destructor
-            namespace
-            constant
-            label
-            section
-            tag
-        other
-            inherited-class
-            attribute-name
+__all__ = ["SCOPE_TREE", "SCOPES", "scopes_flat", "is_valid_scope",
+           "lookup_prefix"]
 
-    invalid
-        illegal
-        deprecated
 
-    keyword
-        context
-            block
-            resource
-        control
-            conditional
-                case
-                else
-                elseif
-                end
-                if
-                select
-                switch
-            exception
-                assert
-                catch
-                defer
-                end
-                finally
-                try
-            flow
-                await
-                break
-                continue
-                goto
-                panic
-                return
-                throw
-                yield
-            loop
-                do-while
-                end
-                for
-                repeat-until
-                while
-            import
-        declaration
-            class
-            enum
-            function
-            interface
-            impl
-            struct
-            trait
-            union
-        import
-            from
-        operator
-            assignment
-            arithmetic
-            bitwise
-            comparison
-            logical
-            word
-        other
+def _freeze(tree):
+    # Names such as "begin" or "other" recur throughout the tree;
+    # intern them so equal names share one object.
+    return types.MappingProxyType({sys.intern(name): _freeze(children)
+                                   for name, children in tree})
 
-    markup
-        heading
-        list
-            numbered
-            unnumbered
-        bold
-        italic
-        underline
-            link
-        inserted
-        deleted
-        quote
-        raw
-            inline
-            block
-        info
-        warning
-        error
-        other
 
-    meta
-        class
-        struct
-        enum
-        union
-        trait
-        interface
-        impl
-        type
-        function
-            identifier
-            parameters
-            return-type
-        function-call
-            identifier
-            arguments
-        namespace
-        number
-            float
-                binary
-                octal
-                decimal
-                hexadecimal
-                other
-            imaginary
-                binary
-                octal
-                decimal
-                hexadecimal
-                other
-            integer
-                binary
-                octal
-                decimal
-                hexadecimal
-                other
-        preprocessor
-        annotation
-            identifier
-            parameters
-        path
-        block
-        braces
-        group
-        parens
-        brackets
-        generic
-        tag
-        paragraph
-        toc-list
-        string
-        interpolation
-        sequence
-        mapping
-            key
-            value
-        set
+# Read-only mapping of each scope name to a mapping of its children,
+# e.g. ``SCOPES['comment']['line']['double-slash']``.
+SCOPES = _freeze(SCOPE_TREE)
 
-    punctuation
-        definition
-            annotation
-                begin
-                end
-            string
-                begin
-                end
-            comment
-                begin
-                end
-            keyword
-                begin
-                end
-            generic
-                begin
-                end
-            placeholder
-                begin
-                end
-            variable
-                begin
-                end
-        section
-            block
-                begin
-                end
-            braces
-                begin
-                end
-            group
-                begin
-                end
-            parens
-                begin
-                end
-            brackets
-                begin
-                end
-            sequence
-                begin
-                end
-            mapping
-                begin
-                end
-            set
-                begin
-                end
-            interpolation
-                begin
-                end
-        separator
-            continuation
-            sequence
-            mapping
-                key-value
-                pair
-            decimal
-        terminator
-        accessor
-            arrow
-            dot
-            double-colon
-            fat-arrow
-            colon
-            backslash
 
-    storage
-        type
-            function
-            class
-            struct
-            enum
-            union
-            trait
-            interface
-            impl
-        modifier
+def _flatten(scopes, prefix=""):
+    for name, children in scopes.items():
+        path = prefix + name
+        yield path
+        yield from _flatten(children, path + ".")
 
-    string
-        quoted
-            single
-            double
-            triple
-            other
-        unquoted
-        regexp
-        other
 
-    support
-        constant
-        function
-        module
-        type
-        class
-        other
+@functools.lru_cache()
+def scopes_flat():
+    """Returns all fully-qualified scope names,
+    e.g. ``"punctuation.definition.string.begin"``, as a frozenset.
 
-    variable
-        language
-        parameter
-        function
-        annotation
-        other
-            constant
-            member
-            readwrite
+    Built on first use and cached afterwards.
+    """
+    return frozenset(sys.intern(path) for path in _flatten(SCOPES))
 
-    source
-    text
 
-    color
-        bluish
-        cyanish
-        greenish
-        orangish
-        pinkish
-        purplish
-        redish
-        yellowish
-"""
+def is_valid_scope(name):
+    """Returns `True` if `name` is a scope in the naming conventions.
+    """
+    return name in scopes_flat()
+
+
+def lookup_prefix(scope):
+    """Returns the longest leading part of `scope` found in the naming conventions,
+    as a tuple of segments.
+
+        lookup_prefix("comment.line.double-slash.js")  # ('comment', 'line', 'double-slash')
+        lookup_prefix("foo.bar")                       # ()
+    """
+    path = []
+    scopes = SCOPES
+    for token in scope.split("."):
+        if token not in scopes:
+            break
+        path.append(token)
+        scopes = scopes[token]
+    return tuple(path)
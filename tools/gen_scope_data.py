@@ -0,0 +1,68 @@
+"""Generate ``plugins/lib/scope_data/_scopes.py`` from ``_data.txt``.
+
+``_data.txt`` lists the scope naming conventions as an indented tree
+(4 spaces per level) and is the file to edit.
+Re-run this script afterwards to update the generated module:
+
+    python tools/gen_scope_data.py
+"""
+import os
+
+SCOPE_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              os.pardir, "plugins", "lib", "scope_data")
+SOURCE_PATH = os.path.join(SCOPE_DATA_DIR, "_data.txt")
+TARGET_PATH = os.path.join(SCOPE_DATA_DIR, "_scopes.py")
+
+HEADER = '''\
+# Generated by tools/gen_scope_data.py from _data.txt. Do not edit.
+#
+# https://www.sublimetext.com/docs/3/scope_naming.html
+# https://manual.macromates.com/en/language_grammars#naming_conventions
+
+'''
+
+
+def parse(data):
+    """Parse the indented ``data`` string into a list of ``(name, children)`` pairs."""
+    root = []
+    parents = {0: root}
+
+    # Note: expects sane indentation (4 spaces, one level at a time)
+    for line in data.splitlines():
+        if not line.strip():
+            # skip blank lines
+            continue
+        level = (len(line) - len(line.lstrip(' '))) >> 2
+        children = []
+        parents[level - 1].append((line[level * 4:].rstrip(), children))
+        parents[level] = children
+
+    return root
+
+
+def format_tree(tree, level=1):
+    indent = " " * 4 * level
+    lines = []
+    for name, children in tree:
+        if children:
+            lines.append("%s(%r, (" % (indent, name))
+            lines.extend(format_tree(children, level + 1))
+            lines.append("%s))," % indent)
+        else:
+            lines.append("%s(%r, ())," % (indent, name))
+    return lines
+
+
+def main():
+    with open(SOURCE_PATH) as f:
+        tree = parse(f.read())
+
+    with open(TARGET_PATH, 'w') as f:
+        f.write(HEADER)
+        f.write("SCOPES = (\n")
+        f.write("\n".join(format_tree(tree)))
+        f.write("\n)\n")
+
+
+if __name__ == '__main__':
+    main()